@@ -41,7 +41,6 @@ import functools
 import math
 import sys
 import imath
-import enum
 
 import IECore
 
@@ -101,6 +100,13 @@ _ranges = {
 	"i" : __Range( 0, 1, -sys.float_info.max, sys.float_info.max ),
 }
 
+# The index of each component within the color for its color space.
+_componentIndices = {
+	"r" : 0, "g" : 1, "b" : 2, "a" : 3,
+	"h" : 0, "s" : 1, "v" : 2,
+	"t" : 0, "m" : 1, "i" : 2,
+}
+
 def _drawIndicator( painter, position ) :
 
 	painter.setBrush( QtCore.Qt.transparent )
@@ -129,21 +135,21 @@ class _ComponentSlider( GafferUI.Slider ) :
 
 		self.color = color
 		self.component = component
+		self.__componentIndex = _componentIndices[component]
 		self.__dynamicBackground = dynamicBackground
-		self.__gradientToDraw = None
+		self.__brushToDraw = None
 		self.__size = self.size()
 
 	# Sets the slider color in RGB space for RGBA channels,
 	# HSV space for HSV channels and TMI space for TMI channels.
 	def setColor( self, color ) :
 
-		if (
-			( self.__dynamicBackground and color != self.color ) or
-			( not self.__dynamicBackground and self.component == "s" )
-		) :
-			self.__gradientToDraw = None
+		# The value indicator is repainted by `setValue()`, so we
+		# only need to repaint if the background has changed.
+		if self.__backgroundChanged( color ) :
+			self.__brushToDraw = None
+			self._qtWidget().update()
 		self.color = color
-		self._qtWidget().update()
 
 	def getColor( self ) :
 
@@ -152,7 +158,7 @@ class _ComponentSlider( GafferUI.Slider ) :
 	def setDynamicBackground( self, dynamicBackground ) :
 
 		self.__dynamicBackground = dynamicBackground
-		self.__gradientToDraw = None
+		self.__brushToDraw = None
 		self._qtWidget().update()
 
 	def getDynamicBackground( self ) :
@@ -163,8 +169,8 @@ class _ComponentSlider( GafferUI.Slider ) :
 
 		size = self.size()
 
-		if self.__gradientToDraw is None or size != self.__size :
-			self.__gradientToDraw = QtGui.QLinearGradient( 0, 0, size.x, 0 )
+		if self.__brushToDraw is None or size != self.__size :
+			gradient = QtGui.QLinearGradient( 0, 0, size.x, 0 )
 
 			displayTransform = self.displayTransform()
 
@@ -183,24 +189,38 @@ class _ComponentSlider( GafferUI.Slider ) :
 				elif self.component in "tm" :
 					c1 = imath.Color3f( 0, 0, 0.5 )
 				c2 = imath.Color3f( c1 )
-				a = { "r" : 0, "g" : 1, "b" : 2, "h" : 0, "s" : 1, "v": 2, "t" : 0, "m" : 1, "i" : 2 }[self.component]
-				c1[a] = -1 if self.component in "tm" else 0
-				c2[a] = 1
+				c1[self.__componentIndex] = -1 if self.component in "tm" else 0
+				c2[self.__componentIndex] = 1
 
-			numStops = max( 2, size.x // 2 )
+			if self.component in "hsv" :
+				toRGB = lambda c : c.hsv2rgb()
+			elif self.component in "tmi" :
+				toRGB = _tmiToRGB
+			else :
+				toRGB = lambda c : c
+
+			# Interpolate using floats, so that we only construct a single
+			# Color3f per stop.
+			r, g, b = c1[0], c1[1], c1[2]
+			dr, dg, db = c2[0] - r, c2[1] - g, c2[2] - b
+
+			# Qt interpolates linearly between stops, so we only need enough to
+			# follow the curvature of the hue ramp and the display transform.
+			numStops = max( 2, min( 64, size.x // ( 4 if self.component == "h" else 8 ) ) )
+			stops = []
 			for i in range( 0, numStops ) :
 
 				t = float( i ) / (numStops-1)
-				c = c1 + (c2-c1) * t
-				if self.component in "hsv" :
-					c = c.hsv2rgb()
-				elif self.component in "tmi" :
-					c = _tmiToRGB( c )
+				c = toRGB( imath.Color3f( r + dr * t, g + dg * t, b + db * t ) )
+				stops.append( ( t, self._qtColor( displayTransform( c ) ) ) )
 
-				self.__gradientToDraw.setColorAt( t, self._qtColor( displayTransform( c ) ) )
+			# Set all stops in a single call, since `setColorAt()` keeps the
+			# stops sorted and would be called once per stop.
+			gradient.setStops( stops )
 
-		brush = QtGui.QBrush( self.__gradientToDraw )
-		painter.fillRect( 0, 0, size.x, size.y, brush )
+			self.__brushToDraw = QtGui.QBrush( gradient )
+
+		painter.fillRect( 0, 0, size.x, size.y, self.__brushToDraw )
 		self.__size = size
 
 	def _drawValue( self, painter, value, position, state ) :
@@ -240,9 +260,23 @@ class _ComponentSlider( GafferUI.Slider ) :
 	def _displayTransformChanged( self ) :
 
 		GafferUI.Slider._displayTransformChanged( self )
-		self.__gradientToDraw = None
+		self.__brushToDraw = None
 		self._qtWidget().update()
 
+	# Returns True if changing to `color` would change the background
+	# gradient. The gradient runs across the slider's own component, so
+	# it only depends on the other components. We use this to avoid
+	# rebuilding the gradient of the slider being dragged.
+	def __backgroundChanged( self, color ) :
+
+		if self.component == "a" :
+			return False
+
+		if not self.__dynamicBackground :
+			return self.component == "s" and color[0] != self.color[0]
+
+		return any( color[i] != self.color[i] for i in range( 0, 3 ) if i != self.__componentIndex )
+
 class _ColorField( GafferUI.Widget ) :
 
 	__DragConstraints = enum.Flag( "__DragConstraints", [ "X", "Y" ] )
@@ -345,9 +379,8 @@ class _ColorField( GafferUI.Widget ) :
 		return xIndex, yIndex
 
 	def __zIndex( self ) :
-		zIndex = { "r": 0, "g": 1, "b": 2, "h": 0, "s": 1, "v": 2, "t": 0, "m": 1, "i": 2 }[self.__staticComponent]
 
-		return zIndex
+		return _componentIndices[self.__staticComponent]
 
 	def __useWheel( self ) :
 
@@ -954,7 +987,8 @@ class ColorChooser( GafferUI.Widget ) :
 		# reserve space for each channel with an empty `GafferUI.Image` of the right size.
 		self.__channelIconPlaceholders = { k : GafferUI.Image( "colorFieldEmptyIcon.png" ) for k in "rgbahsvtmi" }
 		self.__spacers = {}
-		self.__componentValueChangedConnections = []
+		# Connections to all the widgets we update in `__updateUIFromColor()`.
+		self.__valueChangedConnections = []
 
 		self.__componentToolTip = "Click to use this component in the color field."
 
@@ -962,7 +996,9 @@ class ColorChooser( GafferUI.Widget ) :
 			with _ColorFieldRowContainer() :
 
 				self.__colorField = _ColorField( color )
-				self.__colorValueChangedConnection = self.__colorField.valueChangedSignal().connect( Gaffer.WeakMethod( self.__colorValueChanged ) )
+				self.__valueChangedConnections.append(
+					self.__colorField.valueChangedSignal().connect( Gaffer.WeakMethod( self.__colorValueChanged ) )
+				)
 
 				with GafferUI.GridContainer( spacing = 0 ) as grid :
 
@@ -1043,11 +1079,11 @@ class ColorChooser( GafferUI.Widget ) :
 						slider = _ComponentSlider( color, component, parenting = { "index" : ( 5, row ) } )
 						self.__sliders[component] = slider
 
-						self.__componentValueChangedConnections.append(
+						self.__valueChangedConnections.append(
 							numericWidget.valueChangedSignal().connect( Gaffer.WeakMethod( self.__componentValueChanged ) )
 						)
 
-						self.__componentValueChangedConnections.append(
+						self.__valueChangedConnections.append(
 							slider.valueChangedSignal().connect( Gaffer.WeakMethod( self.__componentValueChanged ) )
 						)
 
@@ -1356,22 +1392,19 @@ position. When disabled, a static range of values is displayed."""
 		if componentWidget.component in ( "r", "g", "b", "a" ) :
 			newColor = self.__color.__class__( self.__color )
 
-			a = { "r" : 0, "g" : 1, "b" : 2, "a" : 3 }[componentWidget.component]
-			newColor[a] = componentValue
+			newColor[_componentIndices[componentWidget.component]] = componentValue
 
 			self.__setColorInternal( newColor, reason )
 		elif componentWidget.component in ( "h", "s", "v" ) :
 			newColor = self.__colorHSV.__class__( self.__colorHSV )
 
-			a = { "h" : 0, "s" : 1, "v" : 2 }[componentWidget.component]
-			newColor[a] = componentValue
+			newColor[_componentIndices[componentWidget.component]] = componentValue
 
 			self.__setColorInternal( newColor, reason, self.__ColorSpace.HSV )
 		elif componentWidget.component in ( "t", "m", "i" ) :
 			newColor = self.__colorTMI.__class__( self.__colorTMI )
 
-			a = { "t" : 0, "m" : 1, "i" : 2 }[componentWidget.component]
-			newColor[a] = componentValue
+			newColor[_componentIndices[componentWidget.component]] = componentValue
 
 			self.__setColorInternal( newColor, reason, self.__ColorSpace.TMI )
 
@@ -1403,7 +1436,15 @@ position. When disabled, a static range of values is displayed."""
 		}[colorSpace]
 
 		if colorChanged :
-			if colorSpace == self.__ColorSpace.RGB :
+			if colorSpace == self.__ColorSpace.RGB and self.__onlyAlphaDiffers( color ) :
+				# Reuse our existing conversions rather than converting
+				# the unchanged RGB components all over again.
+				colorRGB = color
+				colorHSV = self.__colorHSV.__class__( self.__colorHSV )
+				colorHSV.a = color.a
+				colorTMI = self.__colorTMI.__class__( self.__colorTMI )
+				colorTMI.a = color.a
+			elif colorSpace == self.__ColorSpace.RGB :
 				colorRGB = color
 				colorHSV = color.rgb2hsv()
 				colorTMI = _rgbToTMI( colorRGB )
@@ -1430,19 +1471,26 @@ position. When disabled, a static range of values is displayed."""
 		# in __componentValueChanged means the color value may not correspond
 		# to the value in the ui, even if it hasn't actually changed. Move this
 		# back inside the conditional when we get the clamping performed internally
-		# in NumericWidget.
-		self.__updateUIFromColor()
+		# in NumericWidget. Sliders and the color field already clamp to the hard
+		# limits themselves, so we can skip the update for changes coming from them.
+		if colorChanged or not isinstance( reason, GafferUI.Slider.ValueChangedReason ) :
+			self.__updateUIFromColor()
 
 		if colorChanged or dragBeginOrEnd :
 			# We never optimise away drag begin or end, because it's important
 			# that they emit in pairs.
 			self.__colorChangedSignal( self, reason )
 
+	def __onlyAlphaDiffers( self, color ) :
+
+		return (
+			color.dimensions() == 4 and self.__color.dimensions() == 4 and
+			all( color[i] == self.__color[i] for i in range( 0, 3 ) )
+		)
+
 	def __updateUIFromColor( self ) :
 
-		with Gaffer.Signals.BlockedConnection(
-			self.__componentValueChangedConnections + [ self.__colorValueChangedConnection ]
-		) :
+		with Gaffer.Signals.BlockedConnection( self.__valueChangedConnections ) :
 
 			c = self.getColor()
 
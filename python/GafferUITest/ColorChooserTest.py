@@ -43,12 +43,16 @@ import OpenImageIO
 import IECore
 
 import Gaffer
+import GafferTest
 import GafferUI
 from GafferUI.ColorChooser import _tmiToRGB
 from GafferUI.ColorChooser import _rgbToTMI
+from GafferUI.ColorChooser import _ComponentSlider
 from GafferUI.ColorChooserPlugValueWidget import saveDefaultOptions
 import GafferUITest
 
+from Qt import QtGui
+
 class ColorChooserTest( GafferUITest.TestCase ) :
 
 	def testTMI( self ) :
@@ -96,7 +100,15 @@ class ColorChooserTest( GafferUITest.TestCase ) :
 	def __sliderFromWidget( self, widget, component ) :
 
 		c = self.__colorChooserFromWidget( widget )
-		return c._ColorChooser__sliders[component]
+		return self.__sliderFromColorChooser( c, component )
+
+	def __sliderFromColorChooser( self, colorChooser, component ) :
+
+		return colorChooser._ColorChooser__sliders[component]
+
+	def __numericWidgetFromColorChooser( self, colorChooser, component ) :
+
+		return colorChooser._ColorChooser__numericWidgets[component]
 
 	def __setVisibleComponents( self, widget, channels ) :
 
@@ -303,5 +315,145 @@ class ColorChooserTest( GafferUITest.TestCase ) :
 		self.assertFalse( self.__getDynamicSliderBackgrounds( rgbWidget ) )
 		self.assertFalse( self.__getDynamicSliderBackgrounds( rgbaWidget ) )
 
+	def testAlphaChange( self ) :
+
+		colorChooser = GafferUI.ColorChooser( imath.Color4f( 0.5, 0.25, 0.1, 1.0 ) )
+
+		# Author a low saturation color in HSV space, which won't survive
+		# an exact round trip through RGB.
+		self.__sliderFromColorChooser( colorChooser, "h" ).setValue( 0.3 )
+		self.__sliderFromColorChooser( colorChooser, "s" ).setValue( 0.001 )
+		self.__sliderFromColorChooser( colorChooser, "v" ).setValue( 0.7 )
+
+		rgb = colorChooser.getColor()
+		hsv = colorChooser._ColorChooser__colorHSV
+		tmi = colorChooser._ColorChooser__colorTMI
+		self.assertEqual( hsv, imath.Color4f( 0.3, 0.001, 0.7, 1.0 ) )
+
+		# Changing only alpha should reuse the existing HSV and TMI colors.
+
+		changes = GafferTest.CapturingSlot( colorChooser.colorChangedSignal() )
+		self.__sliderFromColorChooser( colorChooser, "a" ).setValue( 0.25 )
+		self.assertEqual( len( changes ), 1 )
+
+		self.assertEqual( colorChooser.getColor(), imath.Color4f( rgb.r, rgb.g, rgb.b, 0.25 ) )
+		self.assertEqual( colorChooser._ColorChooser__colorHSV, imath.Color4f( hsv.r, hsv.g, hsv.b, 0.25 ) )
+		self.assertEqual( colorChooser._ColorChooser__colorTMI, imath.Color4f( tmi.r, tmi.g, tmi.b, 0.25 ) )
+
+		for c in "hsv" :
+			self.assertEqual( self.__sliderFromColorChooser( colorChooser, c ).getValue(), hsv["hsv".index( c )] )
+
+	def __assertUIConsistent( self, colorChooser ) :
+
+		for components, color in (
+			( "rgb", colorChooser.getColor() ),
+			( "hsv", colorChooser._ColorChooser__colorHSV ),
+			( "tmi", colorChooser._ColorChooser__colorTMI ),
+		) :
+			for index, component in enumerate( components ) :
+				self.assertEqual( self.__sliderFromColorChooser( colorChooser, component ).getValue(), color[index] )
+				self.assertAlmostEqual(
+					self.__numericWidgetFromColorChooser( colorChooser, component ).getValue(), color[index], delta = 1e-4
+				)
+
+	def testUnchangedDragBeginAndEnd( self ) :
+
+		color = imath.Color3f( 0.5, 0.25, 0.1 )
+		colorChooser = GafferUI.ColorChooser( color )
+		changes = GafferTest.CapturingSlot( colorChooser.colorChangedSignal() )
+
+		dragReasons = [ GafferUI.Slider.ValueChangedReason.DragBegin, GafferUI.Slider.ValueChangedReason.DragEnd ]
+
+		for component in "rgbhsvtmi" :
+
+			del changes[:]
+			slider = self.__sliderFromColorChooser( colorChooser, component )
+			for reason in dragReasons :
+				slider._Slider__setValuesInternal( [ slider.getValue() ], reason )
+
+			self.assertEqual( [ c[1] for c in changes ], dragReasons )
+			self.assertEqual( colorChooser.getColor(), color )
+			self.__assertUIConsistent( colorChooser )
+
+		del changes[:]
+		colorField = colorChooser._ColorChooser__colorField
+		for reason in dragReasons :
+			fieldColor, staticComponent = colorField.getColor()
+			colorField._ColorField__setColorInternal( fieldColor, staticComponent, reason )
+
+		self.assertEqual( [ c[1] for c in changes ], dragReasons )
+		self.assertEqual( colorChooser.getColor(), color )
+		self.__assertUIConsistent( colorChooser )
+
+	def testNumericWidgetClamping( self ) :
+
+		colorChooser = GafferUI.ColorChooser( imath.Color3f( 0.5, 0.25, 0.1 ) )
+		numericWidget = self.__numericWidgetFromColorChooser( colorChooser, "s" )
+
+		numericWidget.setValue( 1.5 )
+		self.assertEqual( colorChooser._ColorChooser__colorHSV[1], 1.0 )
+		self.assertEqual( numericWidget.getValue(), 1.0 )
+		self.__assertUIConsistent( colorChooser )
+
+		# The clamped value is unchanged, but must still be written back
+		# to the widget.
+
+		numericWidget.setValue( 2.0 )
+		self.assertEqual( colorChooser._ColorChooser__colorHSV[1], 1.0 )
+		self.assertEqual( numericWidget.getValue(), 1.0 )
+		self.__assertUIConsistent( colorChooser )
+
+	def __drawSliderBackground( self, slider ) :
+
+		image = QtGui.QImage( 100, 10, QtGui.QImage.Format_RGB32 )
+		painter = QtGui.QPainter( image )
+		slider._drawBackground( painter )
+		painter.end()
+
+	def __sliderBackgroundCached( self, slider ) :
+
+		return slider._ComponentSlider__brushToDraw is not None
+
+	def testSliderBackgroundInvalidation( self ) :
+
+		# Dynamic backgrounds depend only on the other components.
+
+		slider = _ComponentSlider( imath.Color3f( 0.5, 0.25, 0.1 ), "r" )
+		self.__drawSliderBackground( slider )
+		self.assertTrue( self.__sliderBackgroundCached( slider ) )
+
+		slider.setColor( imath.Color3f( 0.75, 0.25, 0.1 ) )
+		self.assertTrue( self.__sliderBackgroundCached( slider ) )
+
+		slider.setColor( imath.Color3f( 0.75, 0.5, 0.1 ) )
+		self.assertFalse( self.__sliderBackgroundCached( slider ) )
+
+		# The alpha background never depends on the color.
+
+		slider = _ComponentSlider( imath.Color4f( 0.5, 0.25, 0.1, 1.0 ), "a" )
+		self.__drawSliderBackground( slider )
+
+		slider.setColor( imath.Color4f( 0.75, 0.5, 0.2, 0.5 ) )
+		self.assertTrue( self.__sliderBackgroundCached( slider ) )
+
+		# Static saturation backgrounds depend only on hue.
+
+		slider = _ComponentSlider( imath.Color3f( 0.3, 0.5, 0.7 ), "s", dynamicBackground = False )
+		self.__drawSliderBackground( slider )
+
+		slider.setColor( imath.Color3f( 0.3, 0.75, 0.2 ) )
+		self.assertTrue( self.__sliderBackgroundCached( slider ) )
+
+		slider.setColor( imath.Color3f( 0.6, 0.75, 0.2 ) )
+		self.assertFalse( self.__sliderBackgroundCached( slider ) )
+
+		# Other static backgrounds never depend on the color.
+
+		slider = _ComponentSlider( imath.Color3f( 0.3, 0.5, 0.7 ), "v", dynamicBackground = False )
+		self.__drawSliderBackground( slider )
+
+		slider.setColor( imath.Color3f( 0.6, 0.75, 0.2 ) )
+		self.assertTrue( self.__sliderBackgroundCached( slider ) )
+
 if __name__ == "__main__" :
 	unittest.main()